@@ -2,7 +2,7 @@
 EmojiLikeArbiter 协议实现（生产级）
 
 本实现是 EmojiLikeArbiter 协议的参考实现：
-- 无状态
+- 协议无状态（仅持有本地、不参与协议的缓存：进程内点赞列表拉取缓存、近期判负记录）
 - 弱一致
 - 确定性递补
 - CQHTTP（OneBot v11）语义级通用
@@ -21,9 +21,16 @@ EmojiLikeArbiter 协议实现（生产级）
 from __future__ import annotations
 
 import asyncio
+import time
+from collections import OrderedDict
 from dataclasses import dataclass
 from typing import Any
 
+from .emoji_like import EmojiLikeClient
+
+# 进程内共享，多个仲裁器实例对同一消息的拉取只发出一次请求
+_EMOJI_CLIENT = EmojiLikeClient()
+
 # ======================================================================
 # 仲裁最小不可变上下文
 # ======================================================================
@@ -60,15 +67,29 @@ class EmojiLikeArbiter:
     # ================= 协议常量（严禁配置化） =================
 
     _EMOJI_ID = 289
+    _EMOJI_ID_STR = str(_EMOJI_ID)
     _EMOJI_TYPE = "1"
     _WAIT_SEC = 1.0
 
     _FEEDBACK_EMOJI_ID = 124
+    _FEEDBACK_EMOJI_ID_STR = str(_FEEDBACK_EMOJI_ID)
     _FEEDBACK_EMOJI_TYPE = "1"
     _FEEDBACK_WAIT_SEC = 0.7
 
     _TIME_SLICE = 60
 
+    # ================= 本地调优参数（不影响协议语义） =================
+
+    # 窗口末尾拉取请求的最大提前量
+    _MAX_LEAD = 0.25
+
+    # Phase 1 已判负的消息在该时长内直接判负，不再发起请求
+    _LOSS_TTL = 5.0
+
+    def __init__(self) -> None:
+        # (self_id, message_id) -> Phase 1 判负时刻（monotonic），按时间从旧到新
+        self._recent_losses: OrderedDict[tuple[int, int], float] = OrderedDict()
+
     # ================= 对外唯一入口 =================
 
     async def compete(self, bot: Any, ctx: ArbiterContext) -> bool:
@@ -81,33 +102,39 @@ class EmojiLikeArbiter:
         """
 
         mid = ctx.message_id
+        loop = asyncio.get_running_loop()
 
-        # Phase 1：初始窗口检测
-        if await self._fetch_users(bot, mid, self._EMOJI_ID, self._EMOJI_TYPE):
+        # 协议常量绑定为局部变量，避免热路径上的重复属性查找
+        eid_str, etype, wait = self._EMOJI_ID_STR, self._EMOJI_TYPE, self._WAIT_SEC
+        fb_eid_str, fb_etype = self._FEEDBACK_EMOJI_ID_STR, self._FEEDBACK_EMOJI_TYPE
+        fb_wait = self._FEEDBACK_WAIT_SEC
+
+        # Fast-Path：本地近期已在 Phase 1 判负（占坑表情不会撤销，结论不变）
+        loss_key = (ctx.self_id, mid)
+        lost_at = self._recent_losses.get(loss_key)
+        if lost_at is not None and time.monotonic() - lost_at < self._LOSS_TTL:
             return False
 
-        # Phase 2：占坑
-        try:
-            await bot.set_msg_emoji_like(
-                message_id=mid,
-                emoji_id=self._EMOJI_ID,
-                emoji_type=self._EMOJI_TYPE,
-                set=True,
-            )
-        except Exception:
+        # Phase 1：初始窗口检测（顺带测量一次拉取延迟）
+        started = loop.time()
+        if await self._fetch_users(bot, ctx, eid_str, etype):
+            self._record_loss(loss_key)
             return False
+        latency = loop.time() - started
 
-        # Phase 3：仲裁窗口等待
-        await asyncio.sleep(self._WAIT_SEC)
+        # Phase 2：占坑，窗口计时与占坑请求同时开始
+        deadline = loop.time() + wait
+        if not await self._try_set(bot, ctx, eid_str, etype):
+            return False
 
-        # Phase 4：参与者收集
-        users = await self._fetch_users(bot, mid, self._EMOJI_ID, self._EMOJI_TYPE)
+        # Phase 3 + 4：仲裁窗口等待 + 参与者收集
+        users = await self._fetch_at(bot, ctx, eid_str, etype, deadline, latency)
         if not users:
             # 极端 API 延迟兜底：视为成功
             return True
 
         # Phase 5：胜出顺序计算（仅一次）
-        order = self._decide_order(users, ctx.msg_time)
+        order = self._decide_order(users, ctx.msg_time, self._TIME_SLICE)
         if not order:
             return False
 
@@ -116,83 +143,135 @@ class EmojiLikeArbiter:
             return order[0] == ctx.self_id
 
         # Phase 6：确定性递补确认
-        for candidate in order:
-            if candidate == ctx.self_id:
-                try:
-                    await bot.set_msg_emoji_like(
-                        message_id=mid,
-                        emoji_id=self._FEEDBACK_EMOJI_ID,
-                        emoji_type=self._FEEDBACK_EMOJI_TYPE,
-                        set=True,
+        # 第 i 步仅由 order[i] 设置表情 124，步末观测到确认即判定胜出者；
+        # 首位候选者在线时只需一次观测，最多推进 len(order) 步。
+        fb_task = None
+        try:
+            for candidate in order:
+                if candidate == ctx.self_id:
+                    # 在本步窗口中点设置：距上一步与本步的观测时刻各留半个窗口，
+                    # 容忍各 Bot 之间的步进偏差
+                    fb_task = asyncio.ensure_future(
+                        self._try_set_after(fb_wait / 2, bot, ctx, fb_eid_str, fb_etype)
                     )
-                except Exception:
-                    pass
 
-            await asyncio.sleep(self._FEEDBACK_WAIT_SEC)
+                await asyncio.sleep(fb_wait)
+                feedback_users = await self._fetch_users(bot, ctx, fb_eid_str, fb_etype)
 
-            if await self._has_feedback(bot, mid):
-                return candidate == ctx.self_id
+                # 以确认者本身判定胜出者，不在参与者中的确认（如群成员手动贴表情）忽略
+                for confirmed in order:
+                    if confirmed in feedback_users:
+                        return confirmed == ctx.self_id
 
-        return False
+            return False
+        finally:
+            # 确保确认请求已结束，避免遗留未完成的任务
+            if fb_task is not None:
+                await fb_task
 
     # ================= 内部方法 =================
 
-    async def _fetch_users(
+    def _record_loss(self, key: tuple[int, int]) -> None:
+        """
+        记录 Phase 1 判负，并淘汰过期记录。
+        """
+        now = time.monotonic()
+        losses = self._recent_losses
+        losses[key] = now
+        losses.move_to_end(key)
+        while now - next(iter(losses.values())) >= self._LOSS_TTL:
+            losses.popitem(last=False)
+
+    async def _try_set(
         self,
         bot: Any,
-        message_id: int,
-        emoji_id: int,
+        ctx: ArbiterContext,
+        emoji_id: str,
         emoji_type: str,
-    ) -> list[int]:
+    ) -> bool:
         """
-        拉取指定表情的点赞用户列表。
+        设置指定表情，返回是否成功。
         """
         try:
-            resp = await bot.fetch_emoji_like(
-                message_id=message_id,
-                emojiId=str(emoji_id),
-                emojiType=emoji_type,
+            await bot.set_msg_emoji_like(
+                message_id=ctx.message_id,
+                emoji_id=int(emoji_id),
+                emoji_type=emoji_type,
+                set=True,
             )
         except Exception:
-            return []
-
-        likes = (resp or {}).get("emojiLikesList") or []
-        users: list[int] = []
-
-        for item in likes:
-            try:
-                users.append(int(item["tinyId"]))
-            except Exception:
-                continue
+            return False
+        finally:
+            _EMOJI_CLIENT.invalidate(ctx.self_id, ctx.message_id, emoji_id, emoji_type)
+        return True
 
-        return users
+    async def _try_set_after(
+        self,
+        delay: float,
+        bot: Any,
+        ctx: ArbiterContext,
+        emoji_id: str,
+        emoji_type: str,
+    ) -> bool:
+        """
+        延迟 delay 秒后设置指定表情。
+        """
+        await asyncio.sleep(delay)
+        return await self._try_set(bot, ctx, emoji_id, emoji_type)
 
-    async def _has_feedback(self, bot: Any, message_id: int) -> bool:
+    async def _fetch_users(
+        self,
+        bot: Any,
+        ctx: ArbiterContext,
+        emoji_id: str,
+        emoji_type: str,
+    ) -> list[int]:
         """
-        判断是否观测到胜出确认信号（表情 124）。
+        拉取指定表情的点赞用户列表（升序、去重）。
         """
-        users = await self._fetch_users(
-            bot,
-            message_id,
-            self._FEEDBACK_EMOJI_ID,
-            self._FEEDBACK_EMOJI_TYPE,
+        return await _EMOJI_CLIENT.fetch(
+            bot, ctx.self_id, ctx.message_id, emoji_id, emoji_type
         )
-        return bool(users)
 
-    def _decide_order(self, users: list[int], msg_time: int) -> list[int]:
+    async def _fetch_at(
+        self,
+        bot: Any,
+        ctx: ArbiterContext,
+        emoji_id: str,
+        emoji_type: str,
+        deadline: float,
+        latency: float,
+    ) -> list[int]:
+        """
+        等待至窗口结束时刻（loop.time() 基准）并拉取点赞用户列表。
+
+        请求按单程延迟（latency / 2）提前发出，使服务端的观测时刻对齐窗口结束，
+        而非在窗口结束后再额外等待一个完整往返。
+
+        注意：窗口内不做“参与者已足够即提前返回”的轮询。各 Bot 提前返回的时刻不同，
+        观测到的参与者集合随之不同，会破坏“同一参与者集合”这一协议前提。
+        """
+        lead = min(latency / 2, self._MAX_LEAD)
+        delay = deadline - lead - asyncio.get_running_loop().time()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        return await self._fetch_users(bot, ctx, emoji_id, emoji_type)
+
+    @staticmethod
+    def _decide_order(users: list[int], msg_time: int, time_slice: int) -> list[int]:
         """
         基于确定性规则生成胜出递补顺序。
 
         保证：
         - 顺序在所有 Bot 上完全一致
         - 不随时间推进而变化
+
+        :param users: 升序去重的参与者列表（由 _fetch_users 保证）
         """
-        participants = sorted(set(users))
+        participants = users
         if not participants:
             return []
 
-        base = (msg_time // self._TIME_SLICE) % len(participants)
-        return [
-            participants[(base + i) % len(participants)]
-            for i in range(len(participants))
-        ]
+        slot = msg_time // time_slice
+        base = slot % len(participants)
+        return participants[base:] + participants[:base]
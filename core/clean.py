@@ -1,8 +1,11 @@
 import asyncio
+import functools
 import shutil
 import zoneinfo
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+from apscheduler.jobstores.base import JobLookupError
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
 
@@ -11,6 +14,16 @@ from astrbot.core.config.astrbot_config import AstrBotConfig
 from astrbot.core.star.context import Context
 
 
+@functools.lru_cache(maxsize=8)
+def _tz(name: str | None) -> zoneinfo.ZoneInfo:
+    return zoneinfo.ZoneInfo(name or "Asia/Shanghai")
+
+
+@functools.lru_cache(maxsize=32)
+def _parse_cron(expr: str) -> CronTrigger:
+    return CronTrigger.from_crontab(expr)
+
+
 class CacheCleaner:
     """
     每天固定时间自动清理插件缓存目录的调度器封装。
@@ -18,25 +31,47 @@ class CacheCleaner:
 
     JOBNAME = "CacheCleaner"
 
+    # 进程内共享的调度器，插件重载时复用
+    _scheduler: AsyncIOScheduler | None = None
+    # 共享调度器启动时所在的事件循环
+    _scheduler_loop: asyncio.AbstractEventLoop | None = None
+
     def __init__(self, context: Context, config: AstrBotConfig):
         self.clean_cron = config["clean_cron"]
         self.cache_dir = Path(config["cache_dir"])
-
-        tz = context.get_config().get("timezone")
-        self.timezone = (
-            zoneinfo.ZoneInfo(tz) if tz else zoneinfo.ZoneInfo("Asia/Shanghai")
+        # 独立线程池，避免长时间删除占用默认 executor
+        self._executor = ThreadPoolExecutor(
+            max_workers=4, thread_name_prefix="cache-clean"
         )
-        self.scheduler = AsyncIOScheduler(timezone=self.timezone)
-        self.scheduler.start()
+
+        self.timezone = _tz(context.get_config().get("timezone"))
+        self.scheduler = self._get_scheduler(self.timezone)
+        self.job = None
 
         self.register_task()
 
         logger.info(f"{self.JOBNAME} 已启动，任务周期：{self.clean_cron}")
 
+    @classmethod
+    def _get_scheduler(cls, tz: zoneinfo.ZoneInfo) -> AsyncIOScheduler:
+        """复用同一事件循环上运行中且时区一致的调度器，否则新建"""
+        current_loop = asyncio.get_running_loop()
+        scheduler, loop = cls._scheduler, cls._scheduler_loop
+        if scheduler is not None and scheduler.running:
+            if loop is current_loop and scheduler.timezone == tz:
+                return scheduler
+            # 原事件循环已关闭时无法再投递关闭操作，直接弃用
+            if loop is not None and not loop.is_closed():
+                scheduler.shutdown(wait=False)
+        scheduler = AsyncIOScheduler(timezone=tz)
+        scheduler.start()
+        cls._scheduler, cls._scheduler_loop = scheduler, current_loop
+        return scheduler
+
     def register_task(self):
         try:
-            self.trigger = CronTrigger.from_crontab(self.clean_cron)
-            self.scheduler.add_job(
+            self.trigger = _parse_cron(self.clean_cron)
+            self.job = self.scheduler.add_job(
                 func=self._clean_plugin_cache,
                 trigger=self.trigger,
                 name=f"{self.JOBNAME}_scheduler",
@@ -46,15 +81,41 @@ class CacheCleaner:
             logger.error(f"[{self.JOBNAME}] Cron 格式错误：{e}")
 
     async def _clean_plugin_cache(self) -> None:
-        """删除并重建缓存目录"""
+        """清空并重建缓存目录"""
         loop = asyncio.get_running_loop()
         try:
-            await loop.run_in_executor(None, shutil.rmtree, self.cache_dir)
+            children = await loop.run_in_executor(self._executor, self._list_children)
+            await asyncio.gather(
+                *(
+                    loop.run_in_executor(self._executor, self._remove, child)
+                    for child in children
+                )
+            )
             self.cache_dir.mkdir(parents=True, exist_ok=True)
             logger.info("Cache directory cleaned and recreated.")
         except Exception:
             logger.exception("Error while cleaning cache directory.")
 
+    def _list_children(self) -> list[Path]:
+        if not self.cache_dir.exists():
+            return []
+        return list(self.cache_dir.iterdir())
+
+    @staticmethod
+    def _remove(path: Path) -> None:
+        if path.is_dir() and not path.is_symlink():
+            shutil.rmtree(path)
+        else:
+            path.unlink(missing_ok=True)
+
     async def stop(self):
-        self.scheduler.remove_all_jobs()
+        # 调度器为共享实例，仅移除本实例注册的任务；
+        # 调度器可能已被新实例替换并关闭，此时任务已随之失效
+        if self.job is not None and self.scheduler.running:
+            try:
+                self.job.remove()
+            except JobLookupError:
+                pass
+        self.job = None
+        self._executor.shutdown(wait=False)
         logger.info(f"[{self.JOBNAME}] 已停止")
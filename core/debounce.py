@@ -1,6 +1,7 @@
 # debounce.py
 
-import time
+from collections import OrderedDict
+from time import monotonic
 
 from astrbot.core.config.astrbot_config import AstrBotConfig
 
@@ -15,24 +16,61 @@ class LinkDebouncer:
         # 真正处理
     """
 
+    # 会话数软上限：超出时淘汰最久未活跃的会话，但仅在其已无窗口内记录时才淘汰
+    MAX_SESSIONS = 4096
+    SWEEP_EVERY = 512  # 每隔多少次调用清理一次全部会话
+
     def __init__(self, config: AstrBotConfig):
         self.interval = config["debounce_interval"]
-        self._cache: dict[str, dict[str, float]] = {}  # {session: {link: ts}}
+        # {session: {link: ts}}，bucket 内按记录时间从旧到新排列
+        self._cache: OrderedDict[str, OrderedDict[str, float]] = OrderedDict()
+        self._calls = 0
 
     def hit(self, session: str, link: str) -> bool:
         """返回 True 表示命中防抖，应跳过"""
-        now = time.time()
-        bucket = self._cache.setdefault(session, {})
-
-        # 1. 清理过期
-        for k, ts in list(bucket.items()):
-            if now - ts > self.interval:
-                bucket.pop(k, None)
+        now = monotonic()
+        bucket = self._cache.setdefault(session, OrderedDict())
+        self._cache.move_to_end(session)
+        if len(self._cache) > self.MAX_SESSIONS:
+            self._evict_idle_sessions(now)
 
-        # 2. 检查是否已存在
-        if link in bucket:
+        # 1. 检查是否已存在（仅检查当前链接）
+        ts = bucket.get(link)
+        if ts is not None and now - ts <= self.interval:
             return True
 
-        # 3. 记录本次时间
+        # 2. 记录本次时间
         bucket[link] = now
+        bucket.move_to_end(link)
+
+        # 3. 清理当前会话的过期记录（窗口内的记录一律保留）
+        self._expire(bucket, now)
+
+        # 4. 定期清理其他会话
+        self._calls += 1
+        if self._calls >= self.SWEEP_EVERY:
+            self._calls = 0
+            self._sweep(now)
+
         return False
+
+    def _expire(self, bucket: OrderedDict[str, float], now: float) -> None:
+        """从最旧一端弹出过期记录"""
+        while bucket and now - next(iter(bucket.values())) > self.interval:
+            bucket.popitem(last=False)
+
+    def _evict_idle_sessions(self, now: float) -> None:
+        """从最久未活跃一端移除已无窗口内记录的会话，直至回到上限或遇到活跃会话"""
+        while len(self._cache) > self.MAX_SESSIONS:
+            oldest, bucket = next(iter(self._cache.items()))
+            self._expire(bucket, now)
+            if bucket:
+                return
+            del self._cache[oldest]
+
+    def _sweep(self, now: float) -> None:
+        """清理所有会话的过期记录，并移除空会话"""
+        for session, bucket in list(self._cache.items()):
+            self._expire(bucket, now)
+            if not bucket:
+                del self._cache[session]
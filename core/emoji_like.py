@@ -0,0 +1,135 @@
+"""
+CQHTTP 表情点赞列表拉取客户端
+
+- 并发请求合并：同一 (账号, 消息, 表情) 同时只发出一次 fetch_emoji_like
+- 短时结果缓存：窗口内重复拉取直接复用结果
+- 本地写操作后可立即失效，避免读到写之前的数据
+
+⚠️ 本文件【不依赖任何机器人框架】
+⚠️ 仅假设 bot 对象支持 CQHTTP 标准 action
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import Any
+
+_Key = tuple[int, int, str, str]
+
+
+class EmojiLikeClient:
+    """
+    fetch_emoji_like 的合并 + 短时缓存封装，结果为升序去重的 tinyId 列表。
+    """
+
+    # 需小于仲裁协议中任一轮询间隔，保证后续阶段不会读到前一阶段的结果
+    CACHE_TTL = 0.5
+    CACHE_MAX = 256
+
+    def __init__(self) -> None:
+        # 进行中的请求
+        self._inflight: dict[_Key, asyncio.Future[list[int]]] = {}
+        # 短时结果缓存：key -> (获取时间, 用户列表)
+        self._ttl: dict[_Key, tuple[float, list[int]]] = {}
+
+    async def fetch(
+        self,
+        bot: Any,
+        self_id: int,
+        message_id: int,
+        emoji_id: str,
+        emoji_type: str,
+    ) -> list[int]:
+        """
+        拉取指定表情的点赞用户列表。
+
+        同一账号（self_id）对同一 (消息, 表情) 的并发请求合并为一次 API 调用，
+        结果在 CACHE_TTL 内直接复用。
+        """
+        key = (self_id, message_id, emoji_id, emoji_type)
+
+        cached = self._ttl.get(key)
+        if cached is not None and time.monotonic() - cached[0] < self.CACHE_TTL:
+            return list(cached[1])
+
+        fut = self._inflight.get(key)
+        if fut is None:
+            fut = asyncio.ensure_future(
+                self._request(bot, message_id, emoji_id, emoji_type)
+            )
+            self._inflight[key] = fut
+            fut.add_done_callback(lambda f: self._on_fetched(key, f))
+
+        # shield：单个调用方被取消时不影响其他共享者
+        return list(await asyncio.shield(fut))
+
+    def invalidate(
+        self,
+        self_id: int,
+        message_id: int,
+        emoji_id: str,
+        emoji_type: str,
+    ) -> None:
+        """
+        本地修改表情状态后，丢弃对应的缓存与进行中请求。
+        """
+        key = (self_id, message_id, emoji_id, emoji_type)
+        self._ttl.pop(key, None)
+        self._inflight.pop(key, None)
+
+    def _on_fetched(self, key: _Key, fut: asyncio.Future[list[int]]) -> None:
+        """
+        请求完成回调：移出进行中列表并写入短时缓存。
+        """
+        # 已被 invalidate 摘除的请求，其结果可能早于本地写操作，丢弃
+        if self._inflight.get(key) is not fut:
+            return
+        del self._inflight[key]
+        if fut.cancelled():
+            return
+
+        now = time.monotonic()
+        if len(self._ttl) >= self.CACHE_MAX:
+            self._ttl = {
+                k: v for k, v in self._ttl.items() if now - v[0] < self.CACHE_TTL
+            }
+        self._ttl[key] = (now, fut.result())
+
+    async def _request(
+        self,
+        bot: Any,
+        message_id: int,
+        emoji_id: str,
+        emoji_type: str,
+    ) -> list[int]:
+        """
+        实际调用 fetch_emoji_like 并解析为升序去重的用户列表。
+        """
+        try:
+            resp = await bot.fetch_emoji_like(
+                message_id=message_id,
+                emojiId=emoji_id,
+                emojiType=emoji_type,
+            )
+        except Exception:
+            return []
+
+        likes = (resp or {}).get("emojiLikesList") or []
+
+        # 快速路径：整体解析并去重，仅在存在异常条目时逐条解析
+        try:
+            return sorted(
+                {int(t) for item in likes if (t := item.get("tinyId")) is not None}
+            )
+        except Exception:
+            pass
+
+        users: set[int] = set()
+        for item in likes:
+            try:
+                users.add(int(item["tinyId"]))
+            except Exception:
+                continue
+
+        return sorted(users)